@@ -1,21 +1,23 @@
 # my_agent/agent.py
 # Complete agent.py for Day 1 + Day 2 (time tool + currency tools + calc specialist)
 
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import datetime
-import pytz
-import requests
+import os
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-# ADK imports
-from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from google.adk.tools import AgentTool
-from google.adk.code_executors import BuiltInCodeExecutor
+# The google.adk stack is imported lazily (inside _build_agents) so importing
+# this module stays cheap for code paths that only need the tool functions —
+# e.g. serverless cold starts and tests.
 
 # ---------------------------
 #  -- Utility / helper map --
 # ---------------------------
-# Small map for casual city names -> tz database names (extend as needed)
+# Small map for casual city names -> tz database names (extend as needed).
+# Keys are casefolded once here so lookups can use the input's casefold directly.
 CITY_MAP = {
     "paris": "Europe/Paris",
     "kolkata": "Asia/Kolkata",
@@ -28,6 +30,20 @@ CITY_MAP = {
     "sf": "America/Los_Angeles",
     "san francisco": "America/Los_Angeles",
 }
+CITY_MAP = {k.casefold(): v for k, v in CITY_MAP.items()}
+
+
+@lru_cache(maxsize=256)
+def _tz(name: str) -> ZoneInfo:
+    """Cached ZoneInfo lookup: tz data is parsed once per name."""
+    return ZoneInfo(name)
+
+
+def _fmt12(dt: datetime.datetime) -> str:
+    """Format as 'HH:MM AM/PM' with a few int ops instead of strftime."""
+    h = dt.hour
+    return f"{((h + 11) % 12) + 1:02d}:{dt.minute:02d} {'PM' if h >= 12 else 'AM'}"
+
 
 # ---------------------------
 #  -- Day 1: Time tool --
@@ -37,9 +53,8 @@ def get_current_time(city: str) -> Dict[str, str]:
     Return current time for a city. Accepts casual names (e.g. 'Paris')
     or tz strings (e.g. 'Europe/Paris'). Tries:
       1) CITY_MAP lookup (casual names)
-      2) If input contains '/', treat as tz string and use pytz
-      3) If tz known, try worldtimeapi (no API key) to get precise time with offset
-      4) Fallback to pytz.now if available
+      2) If input contains '/', treat as tz string
+      3) Compute the time locally from the cached tz object
     Returns:
       {"status":"success","city":..., "time":"HH:MM AM/PM"}
       or {"status":"error", "message": "..."}
@@ -47,46 +62,60 @@ def get_current_time(city: str) -> Dict[str, str]:
     if not city or not city.strip():
         return {"status": "error", "message": "No city provided."}
     name = city.strip()
-    name_lower = name.lower()
 
     # 1) map casual names
-    tz_name: Optional[str] = CITY_MAP.get(name_lower)
+    tz_name: Optional[str] = CITY_MAP.get(name.casefold())
 
     # 2) if user already provided tz string format
     if not tz_name and "/" in name:
         tz_name = name
 
-    # 3) If we have a tz name, try worldtimeapi first (better offset handling)
+    # 3) Compute locally: the cached tz object already carries the offset
+    # rules, so there is no need for a network round-trip. Only the tz
+    # lookup itself can fail, so the try block covers exactly that.
     if tz_name:
         try:
-            # worldtimeapi returns ISO datetime with offset
-            resp = requests.get(f"https://worldtimeapi.org/api/timezone/{tz_name}", timeout=6)
-            if resp.status_code == 200:
-                data = resp.json()
-                dt_iso = data.get("datetime")
-                if dt_iso:
-                    # Parse ISO timestamp safely
-                    dt = datetime.datetime.fromisoformat(dt_iso)
-                    return {"status": "success", "city": name, "time": dt.strftime("%I:%M %p")}
-            # fallback to pytz if worldtimeapi fails
-        except Exception:
-            pass
-
-        # fallback: use pytz
-        try:
-            tz = pytz.timezone(tz_name)
-            now = datetime.datetime.now(tz)
-            return {"status": "success", "city": name, "time": now.strftime("%I:%M %p")}
-        except Exception as e:
+            tz = _tz(tz_name)
+        except (ZoneInfoNotFoundError, ValueError) as e:
             return {"status": "error", "message": f"Could not determine time for '{name}' ({e})"}
+        now = datetime.datetime.now(tz)
+        return {"status": "success", "city": name, "time": _fmt12(now)}
 
     # 4) Nothing found
     return {"status": "error", "message": f"Unknown city or timezone '{name}'. Try 'Paris' or 'Europe/Paris'."}
 
 
+def get_current_times(cities: List[str]) -> List[Dict[str, str]]:
+    """
+    Batched variant of get_current_time: resolves a whole list of cities in
+    one tool call, so multi-city questions cost one round-trip instead of N.
+    Returns a list of per-city results in the same order as the input.
+    """
+    if not cities:
+        return [{"status": "error", "message": "No cities provided."}]
+    return [get_current_time(city) for city in cities]
+
+
 # ---------------------------
 #  -- Day 2: Business Tools --
 # ---------------------------
+# Simulated databases, built once at import and frozen; the tools just probe
+# them instead of reconstructing dicts on every call. Rates are keyed by
+# (base, target) tuples to skip the nested-dict indirection.
+FEE_DB = MappingProxyType({
+    "platinum credit card": 0.02,  # 2%
+    "gold debit card": 0.035,      # 3.5%
+    "bank transfer": 0.01,         # 1%
+})
+
+RATE_DB = MappingProxyType({
+    ("usd", "eur"): 0.93,
+    ("usd", "jpy"): 157.50,
+    ("usd", "inr"): 83.58,
+    # extend as needed
+})
+
+
 def get_fee_for_payment_method(method: str) -> Dict[str, object]:
     """
     Simulated fee lookup.
@@ -96,12 +125,7 @@ def get_fee_for_payment_method(method: str) -> Dict[str, object]:
     """
     if not method:
         return {"status": "error", "error_message": "No payment method provided."}
-    fee_database = {
-        "platinum credit card": 0.02,  # 2%
-        "gold debit card": 0.035,      # 3.5%
-        "bank transfer": 0.01,         # 1%
-    }
-    fee = fee_database.get(method.lower())
+    fee = FEE_DB.get(method.casefold())
     if fee is not None:
         return {"status": "success", "fee_percentage": fee}
     return {"status": "error", "error_message": f"Payment method '{method}' not found"}
@@ -117,77 +141,126 @@ def get_exchange_rate(base_currency: str, target_currency: str) -> Dict[str, obj
     if not base_currency or not target_currency:
         return {"status": "error", "error_message": "Please provide base and target currencies."}
 
-    rate_database = {
-        "usd": {
-            "eur": 0.93,
-            "jpy": 157.50,
-            "inr": 83.58,
-        },
-        # extend as needed
-    }
-    base = base_currency.lower()
-    target = target_currency.lower()
-    rate = rate_database.get(base, {}).get(target)
+    rate = RATE_DB.get((base_currency.casefold(), target_currency.casefold()))
     if rate is not None:
         return {"status": "success", "rate": rate}
     return {"status": "error", "error_message": f"Unsupported currency pair: {base_currency}/{target_currency}"}
 
 
 # ---------------------------
-#  -- Calculation Agent (specialist) --
+#  -- Parallel tool fan-out --
 # ---------------------------
-calculation_agent = LlmAgent(
-    name="calculation_agent",
-    model=Gemini(model="gemini-2.5-flash-lite"),
-    instruction=(
-        "You are a specialized calculator that ONLY responds with valid Python code inside a single "
-        "code block. Do not provide prose. The code must `print()` the final numeric result and any "
-        "intermediate values needed for a readable breakdown. You are forbidden from writing any "
-        "explanations outside the code block."
-    ),
-    code_executor=BuiltInCodeExecutor(),
-)
+# Shared pool so batches of local function tools run concurrently instead of
+# back-to-back; total wall time becomes max(durations), not the sum.
+_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8")))
 
 
-# ---------------------------
-#  -- Enhanced Currency Agent (delegates math) --
-# ---------------------------
-enhanced_currency_agent = LlmAgent(
-    name="enhanced_currency_agent",
-    model=Gemini(model="gemini-2.5-flash-lite"),
-    instruction=(
-        "You are a precise currency conversion assistant. For any conversion request, strictly do the following:\n"
-        "1) Call get_fee_for_payment_method(payment_method) to find the fee percentage.\n"
-        "2) Call get_exchange_rate(base_currency, target_currency) to get the conversion rate.\n"
-        "3) Do NOT perform arithmetic yourself. Instead, generate Python code that computes:\n"
-        "   - fee amount in original currency\n"
-        "   - amount after fee\n"
-        "   - final converted amount\n"
-        "   Then call the calculation agent (provided as a tool) to execute the code and return results.\n"
-        "4) Present a clear breakdown: original amount, fee%, fee amount, amount after fee, exchange rate, and final result.\n"
-        "5) If any tool returns an error status, stop and explain the error."
-    ),
-    tools=[get_fee_for_payment_method, get_exchange_rate, AgentTool(agent=calculation_agent)],
-)
+def _parallel(tool_calls):
+    """Run [(fn, kwargs), ...] on the shared pool; results keep call order."""
+    futures = [_POOL.submit(fn, **kwargs) for fn, kwargs in tool_calls]
+    return [f.result() for f in futures]
+
+
+def get_fee_and_rate(method: str, base_currency: str, target_currency: str) -> Dict[str, object]:
+    """
+    Combined fee + exchange-rate lookup so the agent gets both values in a
+    single tool call instead of two sequential LLM round-trips. The two
+    lookups are dispatched concurrently on the shared pool.
+    Returns:
+      {"fee": <get_fee_for_payment_method result>, "rate": <get_exchange_rate result>}
+    """
+    fee, rate = _parallel([
+        (get_fee_for_payment_method, {"method": method}),
+        (get_exchange_rate, {"base_currency": base_currency, "target_currency": target_currency}),
+    ])
+    return {"fee": fee, "rate": rate}
+
 
 # ---------------------------
-#  -- Root agent (exposes time + currency capabilities) --
+#  -- Agents (built lazily) --
 # ---------------------------
-# root agent combines: get_current_time tool + enhanced currency agent as an AgentTool
-root_agent = LlmAgent(
-    name="root_agent",
-    model=Gemini(model="gemini-2.5-flash"),
-    instruction=(
-        "You are a multi-tool assistant. You can:\n"
-        " - Tell the current time for cities/timezones using get_current_time(city).\n"
-        " - Perform currency conversions using the enhanced currency agent tool. "
-        "When users ask about money conversion, call the enhanced currency agent (it's available as a tool). "
-        "When users ask about time, call the get_current_time function.\n"
-        "Decide which tool to call based on the user's request and return helpful, structured responses."
-    ),
-    # Tools: function tools and the enhanced agent as a callable tool
-    tools=[get_current_time, get_fee_for_payment_method, get_exchange_rate, AgentTool(agent=enhanced_currency_agent)],
-)
+# Agent construction imports the full google.adk stack and builds Gemini
+# clients, which is by far the heaviest part of this module. It is deferred
+# behind module __getattr__ (PEP 562): accessing `root_agent` (as ADK's
+# entrypoint discovery does) builds everything on first touch.
+def _build_agents():
+    from google.adk.agents import LlmAgent
+    from google.adk.models.google_llm import Gemini
+    from google.adk.tools import AgentTool
+    from google.adk.code_executors import BuiltInCodeExecutor
+
+    # One Gemini client per model, shared by every agent that uses it, so
+    # all calls to the same endpoint reuse one connection and auth cache.
+    gemini_flash = Gemini(model="gemini-2.5-flash")
+    gemini_flash_lite = Gemini(model="gemini-2.5-flash-lite")
+
+    # -- Calculation Agent (specialist) --
+    calculation_agent = LlmAgent(
+        name="calculation_agent",
+        model=gemini_flash_lite,
+        instruction=(
+            "You are a specialized calculator that ONLY responds with valid Python code inside a single "
+            "code block. Do not provide prose. The code must `print()` the final numeric result and any "
+            "intermediate values needed for a readable breakdown. You are forbidden from writing any "
+            "explanations outside the code block."
+        ),
+        code_executor=BuiltInCodeExecutor(),
+    )
+
+    # -- Enhanced Currency Agent (delegates math) --
+    enhanced_currency_agent = LlmAgent(
+        name="enhanced_currency_agent",
+        model=gemini_flash_lite,
+        instruction=(
+            "You are a precise currency conversion assistant. For any conversion request, strictly do the following:\n"
+            "1) Call get_fee_and_rate(method, base_currency, target_currency) ONCE to get both the fee "
+            "percentage and the conversion rate in a single lookup.\n"
+            "2) Do NOT perform arithmetic yourself. Instead, generate Python code that computes:\n"
+            "   - fee amount in original currency\n"
+            "   - amount after fee\n"
+            "   - final converted amount\n"
+            "   Then call the calculation agent (provided as a tool) to execute the code and return results.\n"
+            "3) Present a clear breakdown: original amount, fee%, fee amount, amount after fee, exchange rate, and final result.\n"
+            "4) If any tool returns an error status, stop and explain the error."
+        ),
+        tools=[get_fee_and_rate, get_fee_for_payment_method, get_exchange_rate, AgentTool(agent=calculation_agent)],
+    )
+
+    # -- Root agent (exposes time + currency capabilities) --
+    # combines: get_current_time tool + enhanced currency agent as an AgentTool
+    root_agent = LlmAgent(
+        name="root_agent",
+        model=gemini_flash,
+        instruction=(
+            "You are a multi-tool assistant. You can:\n"
+            " - Tell the current time for cities/timezones using get_current_time(city). "
+            "If the user asks about multiple cities, call get_current_times with the full list "
+            "in one call instead of calling get_current_time repeatedly.\n"
+            " - Perform currency conversions using the enhanced currency agent tool. "
+            "When users ask about money conversion, call the enhanced currency agent (it's available as a tool). "
+            "When users ask about time, call the get_current_time function.\n"
+            "Decide which tool to call based on the user's request and return helpful, structured responses."
+        ),
+        # Tools: function tools and the enhanced agent as a callable tool
+        tools=[get_current_time, get_current_times, get_fee_for_payment_method, get_exchange_rate, AgentTool(agent=enhanced_currency_agent)],
+    )
+
+    return {
+        "calculation_agent": calculation_agent,
+        "enhanced_currency_agent": enhanced_currency_agent,
+        "root_agent": root_agent,
+    }
+
+
+_AGENT_NAMES = frozenset({"calculation_agent", "enhanced_currency_agent", "root_agent"})
+
+
+def __getattr__(name: str):
+    if name in _AGENT_NAMES:
+        globals().update(_build_agents())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Note: ADK looks for a variable called `root_agent` as the entrypoint for the agent.
-# This file defines `root_agent` as the multi-tool LlmAgent.
+# Accessing `my_agent.agent.root_agent` triggers the lazy build above.